@@ -20,6 +20,9 @@ from usajobs_service import USAJobsService
 
 logger = logging.getLogger(__name__)
 
+# Location substrings that route a search to the Armenian job sites
+ARMENIAN_LOCATION_KEYWORDS = ('armenia', 'yerevan', 'gyumri', 'vanadzor', 'gavar', 'dilijan', 'am')
+
 class JobDiscoveryAgent:
     """
     Agent 2: The "Researcher"
@@ -174,9 +177,10 @@ class JobDiscoveryAgent:
                     logger.error(f"[DiscoveryAgent] Adzuna error: {e}")
                 
             # 8. Armenian Scrapers - ONLY search for Armenian locations
+            loc_lower = loc.lower()
             is_armenian_location = any(
-                armenian_keyword in loc.lower() 
-                for armenian_keyword in ['armenia', 'yerevan', 'gyumri', 'vanadzor', 'gavar', 'dilijan', 'am']
+                armenian_keyword in loc_lower
+                for armenian_keyword in ARMENIAN_LOCATION_KEYWORDS
             )
             
             if is_armenian_location and self.armenian:
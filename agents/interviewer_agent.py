@@ -1,7 +1,11 @@
 from typing import Dict, Any, List
 from resilience.resilient_llm_gateway import ResilientLLMGateway
+from llm_cache import LLMResponseCache
 import json
 
+# Generated questions per role/description, shared by all sessions
+QUESTIONS_CACHE = LLMResponseCache(max_entries=256, ttl_seconds=3600)
+
 class InterviewerAgent:
     """
     Agent for conducting mock interviews based on job descriptions.
@@ -24,24 +28,39 @@ class InterviewerAgent:
         ["Question 1", "Question 2", "Question 3"]
         """
         
+        system_instruction = "You are a tough but fair hiring manager."
+        cache_key = QUESTIONS_CACHE.make_key(system_instruction, prompt)
+        
         try:
-            response = await self.llm.chat(
-                messages=[{"role": "user", "content": prompt}],
-                system_instruction="You are a tough but fair hiring manager.",
-                json_mode=True
-            )
+            response = QUESTIONS_CACHE.get(cache_key)
+            from_cache = response is not None
+            if not from_cache:
+                response = await self.llm.chat(
+                    messages=[{"role": "user", "content": prompt}],
+                    system_instruction=system_instruction,
+                    json_mode=True
+                )
             clean = response.replace('```json', '').replace('```', '').strip()
             data = json.loads(clean)
             
             # Handle {"questions": [...]} format
+            questions = []
             if isinstance(data, dict):
                 for key in ["questions", "interview_questions", "list"]:
                     if key in data and isinstance(data[key], list):
-                        return data[key]
-                # Fallback: values() if it looks like a list
-                return list(data.values())[0] if data else []
+                        questions = data[key]
+                        break
+                else:
+                    # Fallback: values() if it looks like a list
+                    questions = list(data.values())[0] if data else []
+            elif isinstance(data, list):
+                questions = data
             
-            return data if isinstance(data, list) else []
+            # Only cache fresh responses that gave a list of questions; a hit
+            # must not refresh its own entry or it would never expire
+            if not from_cache and isinstance(questions, list) and questions:
+                QUESTIONS_CACHE.set(cache_key, response)
+            return questions
         except Exception as e:
             print(f"Error generating questions: {e}")
             return ["Tell me about yourself.", "Why do you want this job?", "What are your strengths?"]
@@ -1,14 +1,151 @@
 from enum import Enum
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
 from dataclasses import dataclass
 from resilience.resilient_llm_gateway import ResilientLLMGateway
+from llm_cache import LLMResponseCache
+import asyncio
+import difflib
 import json
+import re
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class ConversationState(str, Enum):
     # Kept for compatibility, though widely unused in new logic
     GREETING = "greeting"
     READY_TO_SEARCH = "ready_to_search"
 
+class Language(str, Enum):
+    # str-valued, so plain "english" etc. still compare and hash equal
+    ENGLISH = "english"
+    RUSSIAN = "russian"
+    ARMENIAN = "armenian"
+
+# Persona (system) prompt per detected language
+PERSONA_PROMPTS: Dict[Language, str] = {
+    Language.ENGLISH: "You are TwinWork AI, a friendly job search assistant. Keep it short, professional, and warm. Don't be repetitive.",
+    Language.RUSSIAN: "Ты TwinWork AI — дружелюбный помощник в поиске работы. Будь краток и профессионален.",
+    Language.ARMENIAN: "Դու TwinWork AI-ն ես՝ աշխատանքի որոնման ընկերասեր օգնական: Խոսիր հակիրճ:",
+}
+
+# Name introductions ("i am", "i'm", "my name is", "call me") in one pass.
+# Captured word must look like a name: 2+ letters (any script), no digits
+NAME_RE = re.compile(r"(?:i\s+am|i'm|my\s+name\s+is|call\s+me)\s+([^\W\d_]{2,})\b")
+
+# Role in "interview me for a [ROLE]" requests
+INTERVIEW_ROLE_RE = re.compile(r"interview (?:me )?(?:for |as )?(?:a )?(.+)")
+
+# Separator in comma-separated skill strings ("Python , SQL,Excel")
+SKILL_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# JSON object embedded in a chatty LLM reply
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Above this length (e.g. a pasted CV) language detection counts scripts with NumPy
+LONG_TEXT_CHARS = 256
+
+# Shorter text: "more than 3 Armenian / Cyrillic characters", checked in C
+ARMENIAN_SCRIPT_RE = re.compile(r"(?:[^\u0530-\u0588]*[\u0530-\u0588]){4}")
+CYRILLIC_SCRIPT_RE = re.compile(r"(?:[^\u0400-\u04FF]*[\u0400-\u04FF]){4}")
+
+# Max time to wait for the conversational reply before answering without the LLM
+RESPONSE_TIMEOUT_SECONDS = 8.0
+
+# Per-turn note appended to the reply prompt (filled in with str.format)
+REPLY_NOTE_TEMPLATE = (
+    "[System Note: Current User Profile: {profile}\n"
+    "Missing Information: {missing}\n"
+    "Ready to Search: {ready}]\n"
+    "[Instruction: {task}]"
+)
+REPLY_TASK_BASE = "Task: Reply to the user. Acknowledge what they said."
+REPLY_TASK_ASK_MISSING = REPLY_TASK_BASE + " Politely ask for the missing info: {missing}."
+REPLY_TASK_SEARCH = REPLY_TASK_BASE + " Tell them you will look for matching jobs now (don't ask more questions)."
+
+# Replies used when the LLM is unavailable or too slow
+FALLBACK_MISSING_INFO = "I'd like to help you find jobs, but I need to know: {missing}. Could you share that with me?"
+FALLBACK_READY = "Great! I have all the information I need. Let me search for matching jobs now."
+FALLBACK_GENERIC = "I'm having trouble connecting to the AI service right now, but I'm still here to help. What would you like to tell me?"
+
+# Cap on user text sent to the LLM (~500 tokens); longer pastes are truncated
+MAX_LLM_INPUT_CHARS = 2000
+
+# Keywords recognised by the regex fallback extraction
+FALLBACK_JOB_ROLES = (
+    'call center', 'customer service', 'support', 'developer', 'engineer', 'programmer',
+    'designer', 'teacher', 'taxi driver', 'driver', 'nurse', 'doctor', 'manager',
+    'accountant', 'sales', 'marketing', 'analyst', 'consultant', 'chef', 'cook',
+    'waiter', 'bartender', 'cleaner', 'security', 'receptionist', 'assistant'
+)
+# Known locations, lowercased keyword -> the form stored in the profile
+FALLBACK_LOCATIONS = {
+    'berlin': 'Berlin', 'london': 'London', 'paris': 'Paris', 'yerevan': 'Yerevan',
+    'moscow': 'Moscow', 'dubai': 'Dubai', 'new york': 'New York', 'remote': 'Remote',
+    'armenia': 'Armenia', 'germany': 'Germany', 'uk': 'UK', 'usa': 'USA',
+    'france': 'France', 'russia': 'Russia'
+}
+
+# One scan per field: the leftmost keyword in the message wins, longest first
+# at the same position ("taxi driver" over "driver")
+FALLBACK_ROLE_RE = re.compile("|".join(map(re.escape, sorted(FALLBACK_JOB_ROLES, key=len, reverse=True))))
+# Locations must be whole words: "armenian" is a language, not Armenia
+FALLBACK_LOCATION_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(FALLBACK_LOCATIONS, key=len, reverse=True))) + r")\b")
+
+# Work-mode mentions for the fallback extractor, named by the preference they signal
+REMOTE_PREF_RE = re.compile(r"(?P<remote>remote|work from home|wfh)|(?P<onsite>\b(?:office|onsite|on-site)\b)")
+
+# A message that is just one of these keywords is extracted locally, without the LLM
+LOCAL_ANSWERS = frozenset(FALLBACK_JOB_ROLES).union(FALLBACK_LOCATIONS)
+
+# Extraction instructions. Kept byte-identical across calls so providers can
+# reuse their cached prefix, and so EXTRACTION_CACHE keys stay stable
+EXTRACTION_SYSTEM_PROMPT = """You are a smart job recruiter assistant.
+Extract structured data from the user's message.
+
+Fields to extract:
+- "name": User's name
+- "job_role": Desired job title(s). If multiple, join them with 'and' (e.g. "Driver and Teacher").
+- "skills": List of skills (e.g. ["Math", "Teaching", "Python"])
+- "location": Desired city/country (e.g. "Yerevan", "Remote")
+- "remote_type": "remote", "onsite", "hybrid", or "any"
+- "min_rate": Minimum hourly rate (number). If they specify currency (e.g. "20 GBP"), extract it to "currency" field.
+- "currency": Currency code (USD, GBP, EUR, AED, AMD, RUB). Default to "USD" if unsure but symbol is $.
+- "max_hours": Max hours per week (number)
+- "busy_schedule": Dictionary of busy times per day. Format: {"Mon": [[start_min, end_min], ...], "Tue": ...}.
+  "Day off" phrases (e.g., "Wednesday is my day off") -> Full day busy: {"Wed": [[0, 1440]]}.
+  "Mornings only" (wants to work mornings) -> Busy in afternoons/evenings: Every day [[720, 1440]] (12pm-12am busy).
+  "Afternoons only" -> Busy in mornings: Every day [[0, 720]] (12am-12pm busy).
+  "Weekends off" -> Busy Sat/Sun [[0, 1440]].
+  "Weekdays only" -> Same as Weekends off.
+
+Task:
+1. Analyze the user's latest message.
+2. Return a JSON object with ONLY the fields found in the message.
+3. Do NOT invent information. If the user didn't say it, DO NOT include the key.
+4. If input is empty or just a greeting, return {}.
+5. If user says "no", "none", or declines a preference question, DO NOT return an empty string for that field. Just omit it.
+
+Example Input: "I am John, looking for python jobs or driver work in London, busy on mondays"
+Example Output: {"name": "John", "job_role": "Python Developer and Driver", "skills": ["Python", "Driving"], "location": "London", "busy_schedule": {"Mon": [[0, 1440]]}}
+
+Example Input: "no"  (User responding to 'any company preference?')
+Example Output: {}
+
+Example Input: "Hi"
+Example Output: {}"""
+
+# Similarity (0-1) needed to treat an unknown bare answer as a typo of a known location
+LOCATION_MATCH_CUTOFF = 0.85
+
+# LLM extraction responses, shared by all chat sessions
+EXTRACTION_CACHE = LLMResponseCache(max_entries=512, ttl_seconds=3600)
+
+# Extraction LLM calls currently in flight, by cache key, so concurrent identical
+# messages from different sessions share one provider request
+EXTRACTION_INFLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
 @dataclass
 class ExtractionResult:
     extracted: Dict[str, Any]
@@ -24,29 +161,38 @@ class UserContextAgent:
         self.llm = llm_gateway
         self.user_profile = {}
         self.chat_history = []  # List of {"role": "user"|"assistant", "content": "..."}
-        self.language = "english"
+        self.language = Language.ENGLISH
         
         # Define what we need before searching
         self.required_fields = ["location"] 
         # "skills" OR "job_role" is also needed, checking logic below
 
-    async def process_message(self, text: str) -> Tuple[str, bool]:
+    async def process_message(self, text: str, on_chunk: Optional[Callable[[str], Awaitable[None]]] = None) -> Tuple[str, bool]:
         """
         Process user message, update state, return response.
+        If `on_chunk` is given, the LLM reply is streamed to it as it is generated
+        (the full text is still returned).
         Returns: (response_text, ready_to_search_boolean)
         """
         # 1. Update History
-        self.chat_history.append({"role": "user", "content": text})
+        # Collapse whitespace and cap what goes to the LLM, so a huge paste
+        # doesn't inflate prompt cost and latency on this and later turns
+        llm_text = " ".join(text.split())[:MAX_LLM_INPUT_CHARS]
+        self.chat_history.append({"role": "user", "content": llm_text})
         
         # 2. Detect Language (simple heuristic, can be improved)
         self.language = self._detect_language(text)
         
+        # Lowercase once per turn; shared by extraction and intent checks
+        msg_lower = text.lower()
+        
         # 3. Holistic Extraction: Try to extract EVERYTHING new from this message
-        # Skip if text is empty (initial connection) or too short to contain info
-        if not text or len(text.strip()) < 2:
+        # Skip if text is empty (initial connection), too short, or has no letters/digits
+        # at all (emoji, "?", "...") - nothing there for the LLM to extract
+        if len(text.strip()) < 2 or not any(c.isalnum() for c in text):
             extraction = ExtractionResult({})
         else:
-            extraction = await self._extract_info(text)
+            extraction = await self._extract_info(llm_text, msg_lower)
         
         # 4. Update Profile with new info
         if extraction.extracted:
@@ -61,7 +207,7 @@ class UserContextAgent:
                             self.user_profile[k] = v
                     elif k == "skills":
                         if not isinstance(v, list):
-                            v = [s.strip() for s in v.split(",") if s.strip()]
+                            v = [s for s in SKILL_SPLIT_RE.split(v.strip()) if s]
                         if k not in self.user_profile:
                             self.user_profile[k] = []
                         self.user_profile[k].extend(v)
@@ -70,150 +216,161 @@ class UserContextAgent:
                         self.user_profile[k] = v
         
         # 5. Check for Special AI Intents (Interview / Salary)
-        msg_lower = text.lower()
-        
-        # Intent: Salary Prediction
-        if "salary" in msg_lower and ("predict" in msg_lower or "what is" in msg_lower or "estimate" in msg_lower):
-            # Parse role/location quickly (simple heuristic for now)
-            # "Salary for Python Dev in London"
-            role = self.user_profile.get("job_role", "Software Engineer")
-            loc = self.user_profile.get("location", "London")
-            
-            try:
-                from market_intelligence import SalaryPredictor
-                predictor = SalaryPredictor()
-                prediction = await predictor.predict_salary(role, loc)
-                
-                if "error" not in prediction:
-                    curr = prediction.get('currency', 'USD')
-                    r = f"💰 **Estimated Salary for {role} in {loc}:**\n"
-                    r += f"Range: {prediction.get('min'):,} - {prediction.get('max'):,} {curr}\n"
-                    r += f"Median: {prediction.get('median'):,} {curr}\n"
-                    r += f"Confidence: {prediction.get('confidence')}"
-                    self.chat_history.append({"role": "assistant", "content": r})
-                    return r, False # Not ready to search for jobs, just answered a query
-            except Exception as e:
-                print(f"[UserAgent] Salary prediction failed: {type(e).__name__}: {e}")
-                r = "I'm having trouble accessing salary data right now. Please try again in a few minutes, or let's continue with your job search."
-                self.chat_history.append({"role": "assistant", "content": r})
-                return r, False
-        
-        # Intent: Mock Interview
-        if "interview" in msg_lower and ("me" in msg_lower or "practice" in msg_lower or "mock" in msg_lower):
-            import re
-            # Try to extract role from specific intents: "interview me for [ROLE]"
-            match = re.search(r"interview (?:me )?(?:for |as )?(?:a )?(.+)", msg_lower)
-            if match:
-                # remove common trailing words if user said "interview me for a taxi driver job"
-                role_candidate = match.group(1).replace("job", "").replace("role", "").replace("position", "").strip()
-                if len(role_candidate) > 2:
-                    role = role_candidate.title()
-                else:
-                    role = self.user_profile.get("job_role", "General Role")
-            else:
-                role = self.user_profile.get("job_role", "General Role")
-            
-            # If we recently searched, pick the first job (mock logic)
-            # Ideally, we'd pick a specific job_id, but for now we generalize.
-            
-            try:
-                from agents.interviewer_agent import InterviewerAgent
-                interviewer = InterviewerAgent()
-                # Pass the SPECIFIC role to the generator
-                questions = await interviewer.generate_questions(role, f"Job Description for {role}")
-                
-                r = f"🎙️ **Mock Interview for {role}**\n\nHere are 3 questions to practice:\n"
-                for i, q in enumerate(questions, 1):
-                    r += f"{i}. {q}\n"
-                r += "\nType your answer to one of them, and I'll review it!"
+        for handler in (self._handle_salary_intent, self._handle_interview_intent):
+            r = await handler(msg_lower)
+            if r is not None:
                 self.chat_history.append({"role": "assistant", "content": r})
-                return r, False # Not ready to search for jobs, just initiated an interview
-            except Exception as e:
-                print(f"[UserAgent] Mock interview generation failed: {type(e).__name__}: {e}")
-                r = "I'm having trouble generating interview questions right now. The AI service might be temporarily unavailable. Let's continue with your job search instead!"
-                self.chat_history.append({"role": "assistant", "content": r})
-                return r, False
+                return r, False # Not ready to search for jobs, just answered a query
         
         # 6. Check if we are ready to search
         # We need at least: (skills OR job_role) AND location
-        has_role_or_skills = bool(self.user_profile.get("skills")) or bool(self.user_profile.get("job_role"))
-        has_location = bool(self.user_profile.get("location"))
+        # The missing list is computed once here and reused for the reply prompt
+        profile = self.user_profile
+        missing = []
+        if not profile.get("job_role") and not profile.get("skills"):
+            missing.append("desired job role or skills")
+        if not profile.get("location"):
+            missing.append("location")
         
-        ready_to_search = has_role_or_skills and has_location
+        ready_to_search = not missing
         
         # 7. Generate Response
-        response = await self._generate_response(text, ready_to_search)
+        response = await self._generate_response(ready_to_search, missing, on_chunk)
         
         self.chat_history.append({"role": "assistant", "content": response})
         return response, ready_to_search
 
-    async def _extract_info(self, text: str) -> ExtractionResult:
-        """
-        Extract ALL relevant fields from the text, regardless of state.
-        """
-        system_prompt = """You are a smart job recruiter assistant. 
-        Extract structured data from the user's message.
-        
-        Fields to extract:
-        - "name": User's name
-        - "job_role": Desired job title(s). If multiple, join them with 'and' (e.g. "Driver and Teacher").
-        - "skills": List of skills (e.g. ["Math", "Teaching", "Python"])
-        - "location": Desired city/country (e.g. "Yerevan", "Remote")
-        - "remote_type": "remote", "onsite", "hybrid", or "any"
-        - "min_rate": Minimum hourly rate (number). If they specify currency (e.g. "20 GBP"), extract it to "currency" field.
-        - "currency": Currency code (USD, GBP, EUR, AED, AMD, RUB). Default to "USD" if unsure but symbol is $.
-        - "max_hours": Max hours per week (number)
-        - "busy_schedule": Dictionary of busy times per day. Format: {"Mon": [[start_min, end_min], ...], "Tue": ...}. 
-          "Day off" phrases (e.g., "Wednesday is my day off") -> Full day busy: {"Wed": [[0, 1440]]}.
-          "Mornings only" (wants to work mornings) -> Busy in afternoons/evenings: Every day [[720, 1440]] (12pm-12am busy).
-          "Afternoons only" -> Busy in mornings: Every day [[0, 720]] (12am-12pm busy).
-          "Weekends off" -> Busy Sat/Sun [[0, 1440]].
-          "Weekdays only" -> Same as Weekends off.
-        
-        Task:
-        1. Analyze the user's latest message.
-        2. Return a JSON object with ONLY the fields found in the message.
-        3. Do NOT invent information. If the user didn't say it, DO NOT include the key.
-        4. If input is empty or just a greeting, return {}.
-        5. If user says "no", "none", or declines a preference question, DO NOT return an empty string for that field. Just omit it.
+    async def _handle_salary_intent(self, msg_lower: str) -> Optional[str]:
+        """Answer "predict/estimate salary" requests. Returns None if the message isn't one."""
+        if not ("salary" in msg_lower and ("predict" in msg_lower or "what is" in msg_lower or "estimate" in msg_lower)):
+            return None
         
-        Example Input: "I am John, looking for python jobs or driver work in London, busy on mondays"
-        Example Output: {"name": "John", "job_role": "Python Developer and Driver", "skills": ["Python", "Driving"], "location": "London", "busy_schedule": {"Mon": [[0, 1440]]}}
-        
-        Example Input: "no"  (User responding to 'any company preference?')
-        Example Output: {}
+        # Parse role/location quickly (simple heuristic for now)
+        # "Salary for Python Dev in London"
+        role = self.user_profile.get("job_role", "Software Engineer")
+        loc = self.user_profile.get("location", "London")
+
+        try:
+            from market_intelligence import SalaryPredictor
+            predictor = SalaryPredictor()
+            prediction = await predictor.predict_salary(role, loc)
+
+            if "error" not in prediction:
+                curr = prediction.get('currency', 'USD')
+                r = f"💰 **Estimated Salary for {role} in {loc}:**\n"
+                r += f"Range: {prediction.get('min'):,} - {prediction.get('max'):,} {curr}\n"
+                r += f"Median: {prediction.get('median'):,} {curr}\n"
+                r += f"Confidence: {prediction.get('confidence')}"
+                return r
+        except Exception as e:
+            print(f"[UserAgent] Salary prediction failed: {type(e).__name__}: {e}")
+            r = "I'm having trouble accessing salary data right now. Please try again in a few minutes, or let's continue with your job search."
+            return r
+        return None
+
+    async def _handle_interview_intent(self, msg_lower: str) -> Optional[str]:
+        """Start a mock interview ("interview me for ..."). Returns None if the message isn't one."""
+        if not ("interview" in msg_lower and ("me" in msg_lower or "practice" in msg_lower or "mock" in msg_lower)):
+            return None
         
-        Example Input: "Hi"
-        Example Output: {}
-        """
+        # Try to extract role from specific intents: "interview me for [ROLE]"
+        match = INTERVIEW_ROLE_RE.search(msg_lower)
+        if match:
+            # remove common trailing words if user said "interview me for a taxi driver job"
+            role_candidate = match.group(1).replace("job", "").replace("role", "").replace("position", "").strip()
+            if len(role_candidate) > 2:
+                role = role_candidate.title()
+            else:
+                role = self.user_profile.get("job_role", "General Role")
+        else:
+            role = self.user_profile.get("job_role", "General Role")
+
+        # If we recently searched, pick the first job (mock logic)
+        # Ideally, we'd pick a specific job_id, but for now we generalize.
 
-        # Call LLM with JSON mode
         try:
-            response_text = await self.llm.chat(
-                messages=[{"role": "user", "content": text}],
-                system_instruction=system_prompt,
-                model_preference="gemini",
-                json_mode=True
-            )
+            from agents.interviewer_agent import InterviewerAgent
+            interviewer = InterviewerAgent()
+            # Pass the SPECIFIC role to the generator
+            questions = await interviewer.generate_questions(role, f"Job Description for {role}")
+
+            r = f"🎙️ **Mock Interview for {role}**\n\nHere are 3 questions to practice:\n"
+            for i, q in enumerate(questions, 1):
+                r += f"{i}. {q}\n"
+            r += "\nType your answer to one of them, and I'll review it!"
+            return r
         except Exception as e:
-            # LLM service unavailable - use fallback extraction
-            print(f"[UserAgent] LLM unavailable for extraction: {type(e).__name__}: {e}")
-            return self._fallback_extraction(text)
+            print(f"[UserAgent] Mock interview generation failed: {type(e).__name__}: {e}")
+            r = "I'm having trouble generating interview questions right now. The AI service might be temporarily unavailable. Let's continue with your job search instead!"
+            return r
+
+    async def _extract_info(self, text: str, text_lower: str) -> ExtractionResult:
+        """
+        Extract ALL relevant fields from the text, regardless of state.
+        """
+
+        # Bare one-keyword answers ("London", "remote", "teacher") don't need the LLM
+        answer = text_lower.strip(" .!?")
+        if answer in LOCAL_ANSWERS:
+            print("[UserAgent] Short answer handled by local extraction")
+            return self._fallback_extraction(text_lower)
+        # ...and neither do misspelled known locations ("londn", "yervan")
+        if 4 <= len(answer) <= 20:
+            location = self._match_known_location(answer)
+            if location:
+                print(f"[UserAgent] Matched '{answer}' to known location '{location}'")
+                return self._fallback_extraction(location)
+
+        # Extraction only depends on the message itself, so identical messages
+        # (e.g. "no", "yes", "ok thanks") can reuse an earlier LLM response.
+        # Keyed on exactly the text sent (case kept), so one session's name
+        # capitalisation never leaks into another's differently-cased message
+        cache_key = EXTRACTION_CACHE.make_key(EXTRACTION_SYSTEM_PROMPT, text)
+        response_text = EXTRACTION_CACHE.get(cache_key)
+        from_cache = response_text is not None
+        
+        if not from_cache:
+            inflight = EXTRACTION_INFLIGHT.get(cache_key)
+            if inflight is None:
+                # Call LLM with JSON mode
+                inflight = asyncio.ensure_future(self.llm.chat(
+                    messages=[{"role": "user", "content": text}],
+                    system_instruction=EXTRACTION_SYSTEM_PROMPT,
+                    model_preference="gemini",
+                    json_mode=True
+                ))
+                EXTRACTION_INFLIGHT[cache_key] = inflight
+                inflight.add_done_callback(lambda _: EXTRACTION_INFLIGHT.pop(cache_key, None))
+            else:
+                print("[UserAgent] Joining in-flight extraction request")
+            try:
+                # Shielded so one session disconnecting doesn't cancel the others' request
+                response_text = await asyncio.shield(inflight)
+            except Exception as e:
+                # LLM service unavailable - use fallback extraction
+                print(f"[UserAgent] LLM unavailable for extraction: {type(e).__name__}: {e}")
+                return self._fallback_extraction(text_lower)
+        else:
+            print("[UserAgent] Using cached extraction response")
         
         if not response_text:
-            return self._fallback_extraction(text)
+            return self._fallback_extraction(text_lower)
             
         try:
             # 1. Try direct parsing
             extracted = json.loads(response_text)
+            # Only cache replies that parsed - never a refusal or stray text.
+            # {} counts: it is the expected answer to greetings and declines
+            if not from_cache and isinstance(extracted, dict):
+                EXTRACTION_CACHE.set(cache_key, response_text)
             # If extraction is empty or incomplete, enhance with fallback
             if not extracted or all(not v for v in extracted.values()):
-                return self._fallback_extraction(text)
+                return self._fallback_extraction(text_lower)
             
             # If LLM extraction is partial, enhance it with fallback
             # This handles cases where LLM might miss location or job_role
             if not extracted.get("location") or not extracted.get("job_role"):
-                fallback = self._fallback_extraction(text)
+                fallback = self._fallback_extraction(text_lower)
                 # Merge fallback data (only add missing fields)
                 for key, value in fallback.extracted.items():
                     if key not in extracted or not extracted[key]:
@@ -223,143 +380,187 @@ class UserContextAgent:
             return ExtractionResult(extracted=extracted)
         except json.JSONDecodeError:
             # 2. Try regex extraction if model added chattiness
-            import re
-            match = re.search(r'\{.*\}', response_text, re.DOTALL)
+            match = JSON_OBJECT_RE.search(response_text)
             if match:
                 try:
                     extracted = json.loads(match.group(0))
+                    if not from_cache and isinstance(extracted, dict):
+                        EXTRACTION_CACHE.set(cache_key, response_text)
                     if extracted and any(v for v in extracted.values()):
                         return ExtractionResult(extracted=extracted)
-                except:
+                except json.JSONDecodeError:
                     pass
             
             # 3. Fallback to regex extraction
             print(f"[UserAgent] JSON Parse Error. Raw: {response_text}")
-            return self._fallback_extraction(text)
+            return self._fallback_extraction(text_lower)
             
         except Exception as e:
             print(f"[UserAgent] Extraction error: {e}")
-            return self._fallback_extraction(text)
+            return self._fallback_extraction(text_lower)
     
-    def _fallback_extraction(self, text: str) -> ExtractionResult:
+    @staticmethod
+    def _match_known_location(answer: str) -> Optional[str]:
+        """
+        Known location that a bare lowercased answer misspells, if any.
+        Words that extend or shorten a location are languages or demonyms
+        ("armenian", "german", "londoner"), not typos - those go to the LLM.
+
+        >>> UserContextAgent._match_known_location("yervan")
+        'yerevan'
+        >>> [UserContextAgent._match_known_location(w) for w in ("armenian", "russian", "german")]
+        [None, None, None]
+        """
+        close = difflib.get_close_matches(answer, FALLBACK_LOCATIONS, n=1, cutoff=LOCATION_MATCH_CUTOFF)
+        if not close:
+            return None
+        location = close[0]
+        if answer.startswith(location) or location.startswith(answer):
+            return None
+        return location
+
+    def _fallback_extraction(self, text_lower: str) -> ExtractionResult:
         """
         Fallback extraction using regex patterns when LLM is unavailable.
+        Expects the already-lowercased user message.
         """
-        import re
-        text_lower = text.lower()
         extracted = {}
         
-        # Common job roles
-        job_roles = [
-            'call center', 'customer service', 'support', 'developer', 'engineer', 'programmer',
-            'designer', 'teacher', 'driver', 'taxi driver', 'nurse', 'doctor', 'manager',
-            'accountant', 'sales', 'marketing', 'analyst', 'consultant', 'chef', 'cook',
-            'waiter', 'bartender', 'cleaner', 'security', 'receptionist', 'assistant'
-        ]
-        
-        # Common locations
-        locations = [
-            'berlin', 'london', 'paris', 'yerevan', 'moscow', 'dubai', 'new york',
-            'remote', 'armenia', 'germany', 'uk', 'usa', 'france', 'russia'
-        ]
-        
         # Extract job role
-        for role in job_roles:
-            if role in text_lower:
-                extracted['job_role'] = role.title()
-                break
+        match = FALLBACK_ROLE_RE.search(text_lower)
+        if match:
+            extracted['job_role'] = match.group(0).title()
         
         # Extract location
-        for loc in locations:
-            if loc in text_lower:
-                extracted['location'] = loc.title()
-                break
+        match = FALLBACK_LOCATION_RE.search(text_lower)
+        if match:
+            extracted['location'] = FALLBACK_LOCATIONS[match.group(0)]
         
-        # Extract name patterns
-        name_patterns = [
-            r"i\s+am\s+(\w+)",
-            r"i'm\s+(\w+)",
-            r"my\s+name\s+is\s+(\w+)",
-            r"call\s+me\s+(\w+)"
-        ]
-        for pattern in name_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                name = match.group(1).capitalize()
-                if len(name) >= 2:
-                    extracted['name'] = name
-                    break
+        # Extract name
+        match = NAME_RE.search(text_lower)
+        if match:
+            extracted['name'] = match.group(1).capitalize()
         
-        # Extract remote preference
-        if 'remote' in text_lower:
+        # Extract remote preference (one scan; a remote mention wins over onsite)
+        prefs = {m.lastgroup for m in REMOTE_PREF_RE.finditer(text_lower)}
+        if 'remote' in prefs:
             extracted['remote_type'] = 'remote'
-        elif 'office' in text_lower or 'onsite' in text_lower:
+        elif 'onsite' in prefs:
             extracted['remote_type'] = 'onsite'
         
         print(f"[UserAgent] Fallback extraction: {extracted}")
         return ExtractionResult(extracted=extracted)
 
-    async def _generate_response(self, user_text: str, ready_to_search: bool) -> str:
+    async def _generate_response(self, ready_to_search: bool, missing: List[str], on_chunk: Optional[Callable[[str], Awaitable[None]]] = None) -> str:
         """
         Generate a conversational response based on what we know and what we need.
+        `missing` lists the profile fields still needed before searching.
         """
-        # Determine missing fields for the prompt
-        missing = []
-        if not self.user_profile.get("job_role") and not self.user_profile.get("skills"):
-            missing.append("desired job role or skills")
-        if not self.user_profile.get("location"):
-            missing.append("location")
-            
         # Persona
         persona = self._get_persona_prompt()
         
-        state_context = f"""
-        Current User Profile: {self.user_profile}
-        Missing Information: {', '.join(missing) if missing else 'None - Ready to Search!'}
-        Ready to Search: {ready_to_search}
-        """
-
-        task_prompt = "Task: Reply to the user. Acknowledge what they said."
+        missing_text = ", ".join(missing)
         if missing:
-            task_prompt += f" Politely ask for the missing info: {', '.join(missing)}."
+            task_prompt = REPLY_TASK_ASK_MISSING.format(missing=missing_text)
         elif ready_to_search:
-            task_prompt += " Tell them you will look for matching jobs now (don't ask more questions)."
+            task_prompt = REPLY_TASK_SEARCH
+        else:
+            task_prompt = REPLY_TASK_BASE
+        note = REPLY_NOTE_TEMPLATE.format(
+            profile=self.user_profile,
+            missing=missing_text or "None - Ready to Search!",
+            ready=ready_to_search,
+            task=task_prompt
+        )
         
         # IMPORTANT: Pass history for context
         # We'll take the last 5 turns to keep context window manageable
         recent_history = self.chat_history[-5:] if self.chat_history else []
         
-        full_messages = recent_history + [{"role": "user", "content": f"[System Note: {state_context}]\n[Instruction: {task_prompt}]"}]
+        full_messages = recent_history + [{"role": "user", "content": note}]
+        
+        if on_chunk and hasattr(self.llm, "chat_stream"):
+            return await self._stream_response(full_messages, persona, missing, ready_to_search, on_chunk)
         
         try:
-            resp = await self.llm.chat(
-                messages=full_messages, 
-                system_instruction=persona, 
-                model_preference="openai"
+            # Don't let a slow provider stall the whole turn
+            resp = await asyncio.wait_for(
+                self.llm.chat(
+                    messages=full_messages, 
+                    system_instruction=persona, 
+                    model_preference="openai"
+                ),
+                timeout=RESPONSE_TIMEOUT_SECONDS
             )
             return resp
+        except asyncio.TimeoutError:
+            print(f"[UserAgent] LLM response timed out after {RESPONSE_TIMEOUT_SECONDS}s - using fallback response")
+            return self._fallback_response(missing, ready_to_search)
         except Exception as e:
             # LLM service unavailable - provide user-friendly fallback message
             print(f"[UserAgent] LLM unavailable for response generation: {type(e).__name__}: {e}")
-            
-            # Generate a simple fallback response based on what we need
-            if missing:
-                return f"I'd like to help you find jobs, but I need to know: {', '.join(missing)}. Could you share that with me?"
-            elif ready_to_search:
-                return "Great! I have all the information I need. Let me search for matching jobs now."
-            else:
-                return "I'm having trouble connecting to the AI service right now, but I'm still here to help. What would you like to tell me?"
+            return self._fallback_response(missing, ready_to_search)
 
-    def _detect_language(self, text: str) -> str:
-        armenian_chars = sum(1 for c in text if '\u0530' <= c <= '\u0588')
-        russian_chars = sum(1 for c in text if '\u0400' <= c <= '\u04FF')
-        if armenian_chars > 3: return "armenian"
-        if russian_chars > 3: return "russian"
-        return "english"
+    async def _stream_response(self, full_messages: List[Dict[str, str]], persona: str, missing: List[str], ready_to_search: bool, on_chunk: Callable[[str], Awaitable[None]]) -> str:
+        """Stream the LLM reply to `on_chunk` and return the full text."""
+        parts: List[str] = []
+        stream = self.llm.chat_stream(
+            messages=full_messages,
+            system_instruction=persona,
+            model_preference="openai"
+        )
+        try:
+            while True:
+                try:
+                    if parts:
+                        chunk = await stream.__anext__()
+                    else:
+                        # Time-box the first chunk; once text is flowing the user sees progress
+                        chunk = await asyncio.wait_for(stream.__anext__(), timeout=RESPONSE_TIMEOUT_SECONDS)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    print(f"[UserAgent] LLM response timed out after {RESPONSE_TIMEOUT_SECONDS}s - using fallback response")
+                    break
+                except Exception as e:
+                    print(f"[UserAgent] LLM unavailable for response generation: {type(e).__name__}: {e}")
+                    break
+                parts.append(chunk)
+                # Outside the provider error handling: a failed send (client gone)
+                # is not an LLM failure and must propagate as itself
+                await on_chunk(chunk)
+        finally:
+            await stream.aclose()
+        
+        # Whatever was already streamed is the reply; otherwise answer without the LLM
+        if parts:
+            return "".join(parts)
+        return self._fallback_response(missing, ready_to_search)
+
+    def _fallback_response(self, missing: List[str], ready_to_search: bool) -> str:
+        """Generate a simple response based on what we need, without the LLM."""
+        if missing:
+            return FALLBACK_MISSING_INFO.format(missing=", ".join(missing))
+        elif ready_to_search:
+            return FALLBACK_READY
+        else:
+            return FALLBACK_GENERIC
+
+    def _detect_language(self, text: str) -> Language:
+        # Most messages are plain ASCII - no need to scan for Armenian/Cyrillic
+        if not text or text.isascii():
+            return Language.ENGLISH
+        if np is not None and len(text) >= LONG_TEXT_CHARS:
+            codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            is_armenian = np.count_nonzero((codepoints >= 0x0530) & (codepoints <= 0x0588)) > 3
+            is_russian = np.count_nonzero((codepoints >= 0x0400) & (codepoints <= 0x04FF)) > 3
+        else:
+            # Regex scan stops as soon as the 4th matching character is seen
+            is_armenian = ARMENIAN_SCRIPT_RE.match(text) is not None
+            is_russian = not is_armenian and CYRILLIC_SCRIPT_RE.match(text) is not None
+        if is_armenian: return Language.ARMENIAN
+        if is_russian: return Language.RUSSIAN
+        return Language.ENGLISH
 
     def _get_persona_prompt(self) -> str:
-        if self.language == "russian":
-            return "Ты TwinWork AI — дружелюбный помощник в поиске работы. Будь краток и профессионален."
-        if self.language == "armenian":
-            return "Դու TwinWork AI-ն ես՝ աշխատանքի որոնման ընկերասեր օգնական: Խոսիր հակիրճ:"
-        return "You are TwinWork AI, a friendly job search assistant. Keep it short, professional, and warm. Don't be repetitive."
+        return PERSONA_PROMPTS.get(self.language, PERSONA_PROMPTS[Language.ENGLISH])
@@ -21,7 +21,7 @@ import asyncio
 import hashlib
 import random
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, quote_plus
 
@@ -77,6 +77,13 @@ class ArmenianJobScraper:
     # Request delay (seconds) - be respectful!
     REQUEST_DELAY = 1.5
     
+    # Schedule inference lookups (built once, not per scraped job); each keyword
+    # group is one alternation so a title is scanned once per group
+    DRIVER_TITLE_RE = re.compile(r"driver|taxi|courier|delivery")
+    CALL_CENTER_TITLE_RE = re.compile(r"call center|support|operator|agent")
+    SHIFT_VARIANT_TITLE_RE = re.compile(r"call center|operator")
+    WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri')
+    
     def __init__(self, cache_file: str = "job_cache.json"):
         self.cache_file = cache_file
         self.cache: Dict[str, Dict] = self._load_cache()
@@ -526,15 +533,15 @@ class ArmenianJobScraper:
         if "remote" in title_lower or "remote" in loc_lower:
              return [], 40
              
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
+        days = self.WEEKDAYS
         
         # Keyword-based Rules
-        if any(w in title_lower for w in ['driver', 'taxi', 'courier', 'delivery']):
+        if self.DRIVER_TITLE_RE.search(title_lower):
             # Evening/Flexible: 18:00 - 23:00 (5h)
             blocks = [TimeBlock(day=d, start=1080, end=1380) for d in days] # 18:00-23:00
             return blocks, 25
             
-        elif any(w in title_lower for w in ['call center', 'support', 'operator', 'agent']):
+        elif self.CALL_CENTER_TITLE_RE.search(title_lower):
             # Shifts: either Morning or Afternoon (based on hash of title)
             # Deterministic variation
             if hash(title) % 2 == 0:
@@ -571,9 +578,9 @@ class ArmenianJobScraper:
             hourly_rate = 10.0
 
             # Special Handling for Call Center: create 2 shift variants to ensure pairing
-            if "call center" in scraped.title.lower() or "operator" in scraped.title.lower():
+            if self.SHIFT_VARIANT_TITLE_RE.search(scraped.title.lower()):
                  # Variant 1: Morning
-                 blocks_am = [TimeBlock(day=d, start=480, end=840) for d in ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']]
+                 blocks_am = [TimeBlock(day=d, start=480, end=840) for d in self.WEEKDAYS]
                  job_am = Job(
                     job_id=job_id + "_am",
                     title=f"{scraped.title} (Morning Shift)",
@@ -591,7 +598,7 @@ class ArmenianJobScraper:
                  jobs.append(job_am)
                  
                  # Variant 2: Afternoon (ends at 18:00 to avoid overlap with driver evening shift)
-                 blocks_pm = [TimeBlock(day=d, start=840, end=1080) for d in ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']]
+                 blocks_pm = [TimeBlock(day=d, start=840, end=1080) for d in self.WEEKDAYS]
                  job_pm = Job(
                     job_id=job_id + "_pm",
                     title=f"{scraped.title} (Afternoon Shift)",
@@ -666,7 +673,8 @@ class ArmenianJobScraper:
         try:
             parts = time_str.split(':')
             return int(parts[0]) * 60 + int(parts[1])
-        except:
+        except (AttributeError, IndexError, ValueError):
+            # Missing (None), "9" with no minutes, or non-numeric parts
             return 540  # Default 9:00
     
     def _estimate_hourly_rate(
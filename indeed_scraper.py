@@ -13,17 +13,23 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import random
+import re
 from models import Job
 from schedule_inference import infer_schedule_from_title
 
 logger = logging.getLogger(__name__)
 
+# First number in a salary string ("$22.50 an hour", "$50,000 a year")
+SALARY_NUMBER_RE = re.compile(r"(\d+\.?\d*)")
+
 class IndeedScraper:
     """Scrape Indeed jobs with Selenium (Headless mode)"""
     
     def __init__(self):
         self.driver = None
         self.base_url = "https://www.indeed.com/jobs"
+        # One browser per scraper, shared by all searches - they take turns
+        self._lock = asyncio.Lock()
         
     def _init_driver(self):
         """Initialize Chrome driver with headless options and anti-detection"""
@@ -72,8 +78,19 @@ class IndeedScraper:
         results_per_page: int = 100
     ) -> List[Job]:
         """Search Indeed jobs and extract with apply links"""
+        async with self._lock:
+            return await self._search_jobs(query, location, results_per_page)
+
+    async def _search_jobs(
+        self,
+        query: str,
+        location: str = "",
+        results_per_page: int = 100
+    ) -> List[Job]:
         try:
-            self._init_driver()
+            # Selenium calls block, so run them in a worker thread to keep the
+            # event loop (and every other chat session) responsive
+            await asyncio.to_thread(self._init_driver)
             
             # Build search URL
             search_url = f"{self.base_url}?q={query.replace(' ', '+')}"
@@ -83,11 +100,11 @@ class IndeedScraper:
             logger.info(f"🔍 Scraping Indeed (headless): {search_url}")
             
             await asyncio.sleep(random.uniform(2, 4))
-            self.driver.get(search_url)
+            await asyncio.to_thread(self.driver.get, search_url)
             
             wait = WebDriverWait(self.driver, 15)
             try:
-                wait.until(EC.presence_of_all_elements_located(
+                await asyncio.to_thread(wait.until, EC.presence_of_all_elements_located(
                     (By.CSS_SELECTOR, "div.job_seen_beacon, div.jobsearch-SerpJobCard")
                 ))
                 logger.info("✅ Indeed job listings loaded")
@@ -99,17 +116,17 @@ class IndeedScraper:
             
             # Scroll to load more jobs
             for i in range(10):
-                self.driver.execute_script("window.scrollBy(0, 800)")
+                await asyncio.to_thread(self.driver.execute_script, "window.scrollBy(0, 800)")
                 await asyncio.sleep(random.uniform(1, 2))
             
             jobs = []
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon, div.jobsearch-SerpJobCard, td.resultContent")
+            job_cards = await asyncio.to_thread(self.driver.find_elements, By.CSS_SELECTOR, "div.job_seen_beacon, div.jobsearch-SerpJobCard, td.resultContent")
             
             logger.info(f"📋 Found {len(job_cards)} Indeed job cards")
             
             for idx, card in enumerate(job_cards[:results_per_page]):
                 try:
-                    job = self._parse_job_card(card)
+                    job = await asyncio.to_thread(self._parse_job_card, card)
                     if job and job.apply_link:
                         jobs.append(job)
                         logger.info(f"✅ Job {idx+1}: {job.title}")
@@ -125,7 +142,7 @@ class IndeedScraper:
             logger.error(f"❌ Indeed scraping error: {e}")
             return []
         finally:
-            self._close_driver()
+            await asyncio.to_thread(self._close_driver)
     
     def _parse_job_card(self, card) -> Optional[Job]:
         """Parse a single Indeed job card"""
@@ -196,28 +213,24 @@ class IndeedScraper:
     
     def _parse_salary(self, salary_text: str) -> float:
         """Parse salary text to hourly rate"""
-        try:
-            import re
-            salary_text = salary_text.replace("$", "").replace(",", "").strip()
-            
-            if "/hr" in salary_text.lower() or "hour" in salary_text.lower():
-                match = re.search(r"(\d+\.?\d*)", salary_text)
-                if match:
-                    return float(match.group(1))
-            
-            if "year" in salary_text.lower() or "annual" in salary_text.lower():
-                match = re.search(r"(\d+\.?\d*)", salary_text)
-                if match:
-                    annual = float(match.group(1))
-                    if annual < 1000:
-                        annual *= 1000
-                    return annual / 2000
-            
-            match = re.search(r"(\d+\.?\d*)", salary_text)
-            if match:
-                return float(match.group(1))
-                
-        except Exception as e:
-            logger.debug(f"Error parsing salary: {e}")
+        # The pattern only captures digits with an optional decimal part,
+        # so float() on the match cannot fail
+        salary_text = salary_text.replace("$", "").replace(",", "").strip()
+        
+        # Every format uses the first number, so search for it once
+        match = SALARY_NUMBER_RE.search(salary_text)
+        if not match:
+            return 25.0
+        amount = float(match.group(1))
+        salary_lower = salary_text.lower()
+        
+        if "/hr" in salary_lower or "hour" in salary_lower:
+            return amount
+        
+        if "year" in salary_lower or "annual" in salary_lower:
+            annual = amount
+            if annual < 1000:
+                annual *= 1000
+            return annual / 2000
         
-        return 25.0
+        return amount
@@ -15,17 +15,23 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
 import random
+import re
 from models import Job
 from schedule_inference import infer_schedule_from_title
 
 logger = logging.getLogger(__name__)
 
+# First number in a salary string ("45.50/hr", "60K")
+SALARY_NUMBER_RE = re.compile(r"(\d+\.?\d*)")
+
 class LinkedInScraper:
     """Scrape LinkedIn jobs with Selenium (Headless mode)"""
     
     def __init__(self):
         self.driver = None
         self.base_url = "https://www.linkedin.com/jobs/search"
+        # One browser per scraper, shared by all searches - they take turns
+        self._lock = asyncio.Lock()
         
     def _init_driver(self):
         """Initialize Chrome driver with headless options and anti-detection"""
@@ -98,8 +104,19 @@ class LinkedInScraper:
         Returns:
             List of Job objects with apply links
         """
+        async with self._lock:
+            return await self._search_jobs(query, location, results_per_page)
+
+    async def _search_jobs(
+        self,
+        query: str,
+        location: str = "",
+        results_per_page: int = 100
+    ) -> List[Job]:
         try:
-            self._init_driver()
+            # Selenium calls block, so run them in a worker thread to keep the
+            # event loop (and every other chat session) responsive
+            await asyncio.to_thread(self._init_driver)
             
             # Build search URL
             search_url = f"{self.base_url}?keywords={query}"
@@ -111,12 +128,12 @@ class LinkedInScraper:
             # Add random delay to avoid detection
             await asyncio.sleep(random.uniform(2, 4))
             
-            self.driver.get(search_url)
+            await asyncio.to_thread(self.driver.get, search_url)
             
             # Wait for job listings to load with longer timeout
             wait = WebDriverWait(self.driver, 15)
             try:
-                wait.until(EC.presence_of_all_elements_located(
+                await asyncio.to_thread(wait.until, EC.presence_of_all_elements_located(
                     (By.CSS_SELECTOR, "div.base-card")
                 ))
                 logger.info("✅ Job listings loaded")
@@ -129,18 +146,18 @@ class LinkedInScraper:
             
             # Scroll to load more jobs (increased scrolling for more results)
             for i in range(10):  # Increased from 3 to 10 scrolls
-                self.driver.execute_script("window.scrollBy(0, 800)")  # Scroll more per iteration
+                await asyncio.to_thread(self.driver.execute_script, "window.scrollBy(0, 800)")  # Scroll more per iteration
                 await asyncio.sleep(random.uniform(1, 2))
             
             # Extract job listings
             jobs = []
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card")
+            job_cards = await asyncio.to_thread(self.driver.find_elements, By.CSS_SELECTOR, "div.base-card")
             
             logger.info(f"📋 Found {len(job_cards)} job cards")
             
             for idx, card in enumerate(job_cards[:results_per_page]):
                 try:
-                    job = self._parse_job_card(card)
+                    job = await asyncio.to_thread(self._parse_job_card, card)
                     if job and job.apply_link:  # Only include if has apply link
                         jobs.append(job)
                         logger.info(f"✅ Job {idx+1}: {job.title} - {job.apply_link[:50]}...")
@@ -160,7 +177,7 @@ class LinkedInScraper:
             traceback.print_exc()
             return []
         finally:
-            self._close_driver()
+            await asyncio.to_thread(self._close_driver)
     
     def _parse_job_card(self, card) -> Optional[Job]:
         """Parse a single job card"""
@@ -216,34 +233,29 @@ class LinkedInScraper:
     
     def _parse_salary(self, salary_text: str) -> float:
         """Parse salary text to hourly rate"""
-        try:
-            import re
-            
-            # Remove currency symbols and spaces
-            salary_text = salary_text.replace("$", "").replace(",", "").strip()
-            
-            # Check if hourly
-            if "/hr" in salary_text.lower():
-                match = re.search(r"(\d+\.?\d*)", salary_text)
-                if match:
-                    return float(match.group(1))
-            
-            # Check if annual salary
-            if "K" in salary_text or "k" in salary_text:
-                match = re.search(r"(\d+\.?\d*)", salary_text)
-                if match:
-                    annual = float(match.group(1)) * 1000
-                    return annual / 2000  # Convert to hourly (2000 hours/year)
-            
-            # Try to extract any number
-            match = re.search(r"(\d+\.?\d*)", salary_text)
-            if match:
-                return float(match.group(1))
-                
-        except Exception as e:
-            logger.debug(f"Error parsing salary: {e}")
+        # The pattern only captures digits with an optional decimal part,
+        # so float() on the match cannot fail
+        
+        # Remove currency symbols and spaces
+        salary_text = salary_text.replace("$", "").replace(",", "").strip()
+        
+        # Every format uses the first number, so search for it once
+        match = SALARY_NUMBER_RE.search(salary_text)
+        if not match:
+            return 25.0  # Default
+        amount = float(match.group(1))
+        
+        # Check if hourly
+        if "/hr" in salary_text.lower():
+            return amount
+        
+        # Check if annual salary
+        if "K" in salary_text or "k" in salary_text:
+            annual = amount * 1000
+            return annual / 2000  # Convert to hourly (2000 hours/year)
         
-        return 25.0  # Default
+        # Any other number
+        return amount
 
 
 # Async wrapper for easy integration
@@ -0,0 +1,55 @@
+"""
+LLM Response Cache
+In-process LRU cache (with expiry) for LLM responses that depend only on their input
+Shared across chat sessions so repeated messages skip the provider round-trip
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class LLMResponseCache:
+    """
+    Least-recently-used cache of LLM responses keyed by a hash of the request.
+    Entries expire after `ttl_seconds` (default 1 hour).
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the parts that determine the response."""
+        # surrogatepass: a broken emoji in pasted text must not break the turn
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8", "surrogatepass")).hexdigest()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase and collapse whitespace so trivial variations share a key."""
+        return " ".join(text.lower().split())
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,13 +1,61 @@
 import os
+import time
 import google.generativeai as genai
 from openai import AsyncOpenAI
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple, AsyncIterator
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a failing provider for a while.
+    CLOSED -> OPEN after `failure_threshold` consecutive failures.
+    OPEN -> HALF_OPEN after `recovery_timeout` seconds: one trial request is let through,
+    success closes the breaker, failure opens it again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        # OPEN or HALF_OPEN: allow one trial request per recovery window
+        # (also recovers if a trial was cancelled before reporting back)
+        if time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self.state = self.HALF_OPEN
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            print(f"[LLMGateway] {self.name} circuit closed (provider recovered)")
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                print(f"[LLMGateway] {self.name} circuit opened after {self.failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
 
 class LLMGateway:
     """
     Unified gateway for LLM interactions.
     Supports OpenAI (GPT-4o/Turbo) and Google Gemini (Pro/Flash).
     """
+
+    # Failover order when the preferred provider fails (fastest/cheapest first)
+    PROVIDER_ORDER = ("gemini", "openai")
     
     def __init__(self):
         # Load API Keys
@@ -45,6 +93,12 @@ class LLMGateway:
             except Exception as e:
                 print(f"[LLMGateway] Gemini init failed: {e}")
 
+        # One breaker per provider, shared by every session using this gateway
+        self.breakers = {
+            "openai": CircuitBreaker("openai"),
+            "gemini": CircuitBreaker("gemini"),
+        }
+
         # Initialize OpenAI
         self.openai_client = None
         if self.openai_key:
@@ -89,31 +143,123 @@ class LLMGateway:
         """
         response = None
         
-        # Primary Attempt
-        if model_preference == "openai" and self.openai_client:
-            response = await self._call_openai(messages, system_instruction, json_mode)
-        elif model_preference == "gemini" and self.gemini_avaliable:
-            response = await self._call_gemini(messages, system_instruction, json_mode)
-        
-        # Failover Attempt
-        if not response:
-            print(f"[LLMGateway] Primary model {model_preference} failed or N/A. Trying failover...")
-            if model_preference == "openai" and self.gemini_avaliable:
-                response = await self._call_gemini(messages, system_instruction, json_mode)
-            elif model_preference == "gemini" and self.openai_client:
-                response = await self._call_openai(messages, system_instruction, json_mode)
+        # Preferred provider first, then the rest in PROVIDER_ORDER
+        cascade = [model_preference] + [p for p in self.PROVIDER_ORDER if p != model_preference]
+        for provider in cascade:
+            if not self._is_configured(provider):
+                continue
+            if provider != model_preference:
+                print(f"[LLMGateway] Primary model {model_preference} failed or N/A. Trying failover ({provider})...")
+            response = await self._call_provider(provider, messages, system_instruction, json_mode)
+            if response:
+                break
 
         if not response:
             raise Exception("All LLM providers failed or are unconfigured.")
             
         return response
 
+    def _is_configured(self, provider: str) -> bool:
+        if provider == "openai":
+            return self.openai_client is not None
+        if provider == "gemini":
+            return self.gemini_avaliable
+        return False
+
+    async def _call_provider(self, provider: str, messages: List[Dict[str, str]], system_instruction: str, json_mode: bool) -> Optional[str]:
+        """Call a provider through its circuit breaker. Returns None if skipped or failed."""
+        breaker = self.breakers[provider]
+        if not breaker.allow_request():
+            print(f"[LLMGateway] {provider} circuit open - skipping")
+            return None
+
+        started = time.monotonic()
+        if provider == "openai":
+            response = await self._call_openai(messages, system_instruction, json_mode)
+        else:
+            response = await self._call_gemini(messages, system_instruction, json_mode)
+        # Per-call latency, so slow turns can be attributed to the provider (or not)
+        input_chars = len(system_instruction) + sum(len(m["content"]) for m in messages)
+        print(f"[LLMGateway] {provider} {'ok' if response else 'failed'} in {(time.monotonic() - started) * 1000:.0f} ms "
+              f"(input {input_chars} chars, json_mode={json_mode})")
+
+        if response:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return response
+
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_instruction: str = "",
+        model_preference: str = "gemini"
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of chat(): yields the reply in chunks as they arrive.
+        Fails over to the next provider only if nothing has been yielded yet.
+        """
+        cascade = [model_preference] + [p for p in self.PROVIDER_ORDER if p != model_preference]
+        for provider in cascade:
+            if not self._is_configured(provider):
+                continue
+            breaker = self.breakers[provider]
+            if not breaker.allow_request():
+                print(f"[LLMGateway] {provider} circuit open - skipping")
+                continue
+            if provider != model_preference:
+                print(f"[LLMGateway] Primary model {model_preference} failed or N/A. Trying failover ({provider})...")
+
+            if provider == "openai":
+                stream = self._stream_openai(messages, system_instruction)
+            else:
+                stream = self._stream_gemini(messages, system_instruction)
+
+            yielded = False
+            started = time.monotonic()
+            try:
+                async for chunk in stream:
+                    if chunk:
+                        if not yielded:
+                            print(f"[LLMGateway] {provider} first chunk in {(time.monotonic() - started) * 1000:.0f} ms")
+                        yielded = True
+                        yield chunk
+            except Exception as e:
+                print(f"[LLMGateway] {provider} stream error: {e}")
+                breaker.record_failure()
+                if yielded:
+                    # Part of the reply is already out - can't switch provider now
+                    raise
+                continue
+
+            if yielded:
+                print(f"[LLMGateway] {provider} stream done in {(time.monotonic() - started) * 1000:.0f} ms")
+                breaker.record_success()
+                return
+            breaker.record_failure()
+
+        raise Exception("All LLM providers failed or are unconfigured.")
+
+    def _openai_messages(self, messages: List[Dict[str, str]], system_instruction: str) -> List[Dict[str, str]]:
+        msgs = []
+        if system_instruction:
+            msgs.append({"role": "system", "content": system_instruction})
+        msgs.extend(messages)
+        return msgs
+
+    async def _stream_openai(self, messages: List[Dict[str, str]], system_instruction: str) -> AsyncIterator[str]:
+        stream = await self.openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=self._openai_messages(messages, system_instruction),
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def _call_openai(self, messages: List[Dict[str, str]], system_instruction: str, json_mode: bool) -> Optional[str]:
         try:
-            msgs = []
-            if system_instruction:
-                msgs.append({"role": "system", "content": system_instruction})
-            msgs.extend(messages)
+            msgs = self._openai_messages(messages, system_instruction)
             
             completion = await self.openai_client.chat.completions.create(
                 model="gpt-4o-mini", # Cost-effective & fast
@@ -125,20 +271,39 @@ class LLMGateway:
             print(f"[LLMGateway] OpenAI Error: {e}")
             return None
 
+    def _gemini_history(self, messages: List[Dict[str, str]], system_instruction: str) -> Tuple[List[Dict[str, Any]], str]:
+        """Convert OpenAI-format messages to a Gemini chat history plus the final prompt."""
+        # Gemini: history list of content parts
+        history = []
+        last_message = ""
+        
+        for msg in messages:
+            role = "user" if msg["role"] == "user" else "model"
+            content = msg["content"]
+            if msg == messages[-1] and role == "user":
+                last_message = content
+            else:
+                history.append({"role": role, "parts": [content]})
+        
+        # If system instruction is present, prepend it to the final prompt or use system_instruction param if supported by library version
+        # (gemini-1.5 supports system instruction in model init, but here we just prepend to context for simplicity/compatibility)
+        final_prompt = last_message
+        if system_instruction:
+            final_prompt = f"System Instruction: {system_instruction}\n\nUser: {last_message}"
+        return history, final_prompt
+
+    async def _stream_gemini(self, messages: List[Dict[str, str]], system_instruction: str) -> AsyncIterator[str]:
+        history, final_prompt = self._gemini_history(messages, system_instruction)
+        generation_config = genai.types.GenerationConfig(temperature=0.7, response_mime_type="text/plain")
+        chat = self.gemini_model.start_chat(history=history)
+        response = await chat.send_message_async(final_prompt, generation_config=generation_config, stream=True)
+        async for chunk in response:
+            yield chunk.text
+
     async def _call_gemini(self, messages: List[Dict[str, str]], system_instruction: str, json_mode: bool) -> Optional[str]:
         try:
             # Convert OpenAI format to Gemini format
-            # Gemini: history list of content parts
-            history = []
-            last_message = ""
-            
-            for msg in messages:
-                role = "user" if msg["role"] == "user" else "model"
-                content = msg["content"]
-                if msg == messages[-1] and role == "user":
-                    last_message = content
-                else:
-                    history.append({"role": role, "parts": [content]})
+            history, final_prompt = self._gemini_history(messages, system_instruction)
             
             # Configure generation
             generation_config = genai.types.GenerationConfig(
@@ -149,12 +314,6 @@ class LLMGateway:
             # Create chat session
             chat = self.gemini_model.start_chat(history=history)
             
-            # If system instruction is present, prepend it to the final prompt or use system_instruction param if supported by library version
-            # (gemini-1.5 supports system instruction in model init, but here we just prepend to context for simplicity/compatibility)
-            final_prompt = last_message
-            if system_instruction:
-                final_prompt = f"System Instruction: {system_instruction}\n\nUser: {last_message}"
-            
             response = await chat.send_message_async(final_prompt, generation_config=generation_config)
             return response.text
         except Exception as e:
@@ -21,6 +21,9 @@ from agents.matching_agent import MatchingAgent
 
 app = FastAPI()
 
+# Separators for multi-role queries, e.g. "driver and teacher"
+QUERY_SPLIT_RE = re.compile(r' and |,|&')
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -119,11 +122,20 @@ class ChatSession:
             await self.process_input(raw_message)
 
     async def process_input(self, text: str):
-        # 1. Delegate to User Agent
-        response_text, ready_to_search = await self.user_agent.process_message(text)
+        # 1. Delegate to User Agent, streaming the reply as it is generated
+        streamed = False
+
+        async def send_chunk(chunk: str):
+            nonlocal streamed
+            streamed = True
+            await self.websocket.send_json({"type": "text_chunk", "message": chunk})
+
+        response_text, ready_to_search = await self.user_agent.process_message(text, on_chunk=send_chunk)
         
-        # 2. Send Agent Response
-        if response_text:
+        # 2. Send Agent Response (or close the streamed one with the final text)
+        if streamed:
+            await self.websocket.send_json({"type": "text_end", "message": response_text})
+        elif response_text:
             await self.send_message(response_text)
             
         # 3. Check for Search Trigger
@@ -153,17 +165,25 @@ class ChatSession:
         remote_ok = profile.get("remote_ok", False) # Default to false if not specified
         remote_only = remote_ok and not profile.get("onsite_ok", True)
         
-        # Split query for multi-role search
-        sub_queries = [q.strip() for q in re.split(r' and |,|&', query) if q.strip()]
+        # Split query for multi-role search (skip the regex for single-role queries)
+        if ',' in query or '&' in query or ' and ' in query:
+            sub_queries = [q.strip() for q in QUERY_SPLIT_RE.split(query) if q.strip()]
+        else:
+            sub_queries = [query.strip()] if query.strip() else []
         if not sub_queries:
             sub_queries = [query]
             
         all_jobs = []
         seen_ids = set()
         
-        for sub_q in sub_queries:
-             print(f"🔎 Searching for sub-query: {sub_q}")
-             sub_results = await discovery_agent.search(query=sub_q, location=loc, remote_only=remote_only)
+        # Sub-queries are independent - search them concurrently
+        print(f"🔎 Searching for sub-queries: {sub_queries}")
+        results_per_query = await asyncio.gather(*[
+            discovery_agent.search(query=sub_q, location=loc, remote_only=remote_only)
+            for sub_q in sub_queries
+        ])
+        
+        for sub_results in results_per_query:
              for job in sub_results:
                  if job.job_id not in seen_ids:
                      all_jobs.append(job)
@@ -29,16 +29,20 @@ def job_fits_user(job: Job, user: UserProfile) -> Tuple[bool, List[MatchInsight]
 
     # Relaxed skill check for demo/API jobs which might have empty skills
     if job.required_skills:
-        skill_gap = [skill for skill in job.required_skills if skill.lower() not in user.skill_set]
+        user_skills = user.skill_set  # property builds a new set - build it once
+        skill_gap = [skill for skill in job.required_skills if skill.lower() not in user_skills]
         if skill_gap:
             # Strict matching: return False, insights
             # For now, let's allow it if it's an API job (often has no structured skills)
             pass 
 
     location_ok = False
+    # Lowercase once; every location check below compares these
+    job_location = job.location.lower()
+    user_location = user.location.lower() if user.location else ""
     
     # Check if job is remote
-    is_remote = job.is_remote or "remote" in job.location.lower()
+    is_remote = job.is_remote
     
     if is_remote and user.remote_ok:
         # Remote jobs are OK if user accepts remote
@@ -46,17 +50,17 @@ def job_fits_user(job: Job, user: UserProfile) -> Tuple[bool, List[MatchInsight]
     elif not is_remote and user.onsite_ok:
         # Onsite jobs need location match
         # Simple string matching for location
-        if user.location and user.location.lower() in job.location.lower():
+        if user_location and user_location in job_location:
             location_ok = True
-        elif user.location and job.location.lower() in user.location.lower():
+        elif user_location and job_location in user_location:
             location_ok = True
         else:
             # Check preferred locations
             preferred = {loc.lower() for loc in user.preferred_locations or []} if user.preferred_locations else set()
-            if user.location:
-                preferred.add(user.location.lower())
+            if user_location:
+                preferred.add(user_location)
             
-            if job.location.lower() in preferred:
+            if job_location in preferred:
                 location_ok = True
     elif user.remote_ok and is_remote:
         # If we reach here and job is remote, accept it
@@ -44,6 +44,9 @@ def format_time(minutes: int) -> str:
 
 @dataclass(frozen=True)
 class TimeBlock:
+    # Every job carries several blocks - no per-instance __dict__
+    __slots__ = ("day", "start", "end")
+
     day: str
     start: int
     end: int
@@ -60,6 +63,10 @@ class TimeBlock:
     def duration_minutes(self) -> int:
         return self.end - self.start
 
+    def __reduce__(self):
+        # Frozen + __slots__ can't be restored by the default pickle/copy path
+        return (TimeBlock, (self.day, self.start, self.end))
+
 @dataclass
 class Job:
     job_id: str
@@ -3,9 +3,19 @@ Schedule Inference Helper
 Infers work schedules based on job titles and types
 Used by job scrapers that don't provide schedule information
 """
+import re
 from typing import List, Tuple
 from models import TimeBlock
 
+# Title keywords per schedule type; called for every scraped job, so each
+# keyword list is a single precompiled alternation (one pass over the title)
+DRIVER_TITLE_RE = re.compile(r"driver|taxi|courier|delivery|uber|lyft")
+CALL_CENTER_TITLE_RE = re.compile(r"call center|support|operator|agent|customer service|helpdesk")
+PART_TIME_TITLE_RE = re.compile(r"part[ -]?time")
+NIGHT_TITLE_RE = re.compile(r"night|overnight|graveyard")
+
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri')
+
 def infer_schedule_from_title(title: str, location: str = "") -> Tuple[List[TimeBlock], int]:
     """
     Infer schedule blocks and hours per week based on job title keywords
@@ -20,15 +30,15 @@ def infer_schedule_from_title(title: str, location: str = "") -> Tuple[List[Time
     if "remote" in title_lower or "remote" in loc_lower:
         return [], 40
     
-    days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
+    days = WEEKDAYS
     
     # Driver/Taxi/Delivery - Evening shifts (18:00-23:00, 5h/day = 25h/week)
-    if any(w in title_lower for w in ['driver', 'taxi', 'courier', 'delivery', 'uber', 'lyft']):
+    if DRIVER_TITLE_RE.search(title_lower):
         blocks = [TimeBlock(day=d, start=1080, end=1380) for d in days]  # 18:00-23:00
         return blocks, 25
     
     # Call Center/Support - Split into morning and afternoon shifts
-    if any(w in title_lower for w in ['call center', 'support', 'operator', 'agent', 'customer service', 'helpdesk']):
+    if CALL_CENTER_TITLE_RE.search(title_lower):
         # Use hash to deterministically assign shift
         if hash(title) % 2 == 0:
             # Morning: 08:00-14:00 (6h/day = 30h/week)
@@ -40,12 +50,12 @@ def infer_schedule_from_title(title: str, location: str = "") -> Tuple[List[Time
             return blocks, 30
     
     # Part-time - Short shifts (10:00-14:00, 4h/day = 20h/week)
-    if "part time" in title_lower or "part-time" in title_lower or "parttime" in title_lower:
+    if PART_TIME_TITLE_RE.search(title_lower):
         blocks = [TimeBlock(day=d, start=600, end=840) for d in days]
         return blocks, 20
     
     # Night shift
-    if "night" in title_lower or "overnight" in title_lower or "graveyard" in title_lower:
+    if NIGHT_TITLE_RE.search(title_lower):
         blocks = [TimeBlock(day=d, start=1320, end=480) for d in days]  # 22:00-08:00 (crosses midnight)
         return blocks, 40
     
@@ -15,6 +15,10 @@ let currentPairJobs = [];
 let currentScheduleData = [];
 let currentTab = 'single';
 
+// Bot message currently being streamed in (text_chunk ... text_end)
+let streamingContent = null;
+let streamingText = '';
+
 ws.onopen = () => {
     console.log('Connected to chat server');
 };
@@ -31,6 +35,27 @@ ws.onmessage = (event) => {
         // But mainly the server sends a text message after this JSON
     }
 
+    // Streamed bot reply: append chunks to one message bubble
+    if (data.type === 'text_chunk') {
+        if (!streamingContent) {
+            addMessage('', 'bot');
+            streamingContent = chatContainer.lastElementChild.querySelector('.message-content');
+            streamingText = '';
+        }
+        streamingText += data.message;
+        streamingContent.innerHTML = streamingText.replace(/\n/g, '<br>');
+        chatContainer.scrollTop = chatContainer.scrollHeight;
+    }
+
+    if (data.type === 'text_end') {
+        if (streamingContent && data.message) {
+            streamingContent.innerHTML = data.message.replace(/\n/g, '<br>');
+        }
+        streamingContent = null;
+        streamingText = '';
+        optionsContainer.innerHTML = '';
+    }
+
     if (data.type === 'text' || data.type === 'choice') {
         addMessage(data.message, 'bot');
 